@@ -2,16 +2,64 @@
 Lookup info from https://www.crossref.org
 """
 
-from typing import Dict, Iterable, List, Optional, Tuple
+from json import dumps as json_dumps
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple
 
 from ..bibtex.author import Author
 from ..bibtex.constants import FieldNames
 from ..bibtex.entry import BibtexEntry
+from ..bibtex.normalize import normalize_doi
+from ..lookups.abstract_base import Data
+from ..lookups.https import HTTPSRateCapedLookup
 from ..lookups.lookups import JSON_Lookup
-from ..utils.constants import QUERY_MAX_RESULTS
+from ..utils.constants import CROSSREF_BATCH_SIZE, QUERY_MAX_RESULTS
+from ..utils.logger import logger
 from ..utils.safe_json import SafeJSON
 
 
+class CrossrefBatchLookup(HTTPSRateCapedLookup[List[str], Dict[str, bytes]]):
+    """Single batched query for a list of DOIs, using crossref's
+    "filter=doi:a,doi:b,..." syntax to fetch many records in one request
+
+    example URL:
+    https://api.crossref.org/works?filter=doi:10.1109/tro.2004.829459,doi:10.1109/tro.2004.829460
+    """
+
+    name = "crossref"
+
+    domain = "api.crossref.org"
+    path = "/works"
+    # Keep filter separators readable (and the URL shorter)
+    safe = ":,/"
+
+    dois: List[str]
+
+    def __init__(self, input: List[str]) -> None:
+        super().__init__(input)
+        self.dois = input
+
+    def get_params(self) -> Dict[str, str]:
+        return {
+            "filter": ",".join("doi:" + doi for doi in self.dois),
+            "rows": str(len(self.dois)),
+        }
+
+    def process_data(self, data: Data) -> Dict[str, bytes]:
+        """Key each returned record by its (normalized) DOI,
+        re-wrapped as a single-record response for CrossrefLookup's parser"""
+        found: Dict[str, bytes] = {}
+        if data.code != 200:
+            return found
+        json = SafeJSON.from_bytes(data.data)
+        if json["status"].to_str() != "ok":
+            return found
+        for item in json["message"]["items"].iter_list():
+            doi = normalize_doi(item["DOI"].to_str())
+            if doi is not None:
+                found[doi] = json_dumps({"status": "ok", "message": item.value}).encode()
+        return found
+
+
 class CrossrefLookup(JSON_Lookup):
     """Lookup info on https://www.crossref.org
     Uses the crossref REST API, documented here:
@@ -31,11 +79,38 @@ class CrossrefLookup(JSON_Lookup):
     domain = "api.crossref.org"
     path = "/works"
 
+    # Responses prefetched by batched DOI queries, keyed by DOI
+    prefetched: ClassVar[Dict[str, bytes]] = {}
+
+    @classmethod
+    def prefetch(cls, entries: List[BibtexEntry]) -> None:
+        """Queries all known DOIs in batches of CROSSREF_BATCH_SIZE,
+        caching responses so per-entry DOI queries skip the network"""
+        dois: List[str] = []
+        for entry in entries:
+            if not cls(entry).condition():
+                continue
+            doi = entry.doi.to_str()
+            if doi is not None and doi not in dois:
+                dois.append(doi)
+        if not dois:
+            return None
+        logger.verbose_debug("crossref: prefetching {nb} DOIs", nb=len(dois))
+        for start in range(0, len(dois), CROSSREF_BATCH_SIZE):
+            batch = CrossrefBatchLookup(dois[start : start + CROSSREF_BATCH_SIZE])
+            cls.prefetched.update(batch.query() or {})
+
     def get_path(self) -> str:
         if self.doi is not None:
             return self.path + "/" + self.doi
         return super().get_path()
 
+    def get_data(self) -> Optional[Data]:
+        if self.doi is not None and self.doi in self.prefetched:
+            logger.debug("crossref: using prefetched data for {doi}", doi=self.doi)
+            return Data(data=self.prefetched[self.doi], code=200, reason="", delay=0.0)
+        return super().get_data()
+
     def get_params(self) -> Dict[str, str]:
         base = {"rows": str(QUERY_MAX_RESULTS)}
         if self.title is not None:
@@ -47,8 +122,8 @@ class CrossrefLookup(JSON_Lookup):
     def update_rate_cap(self) -> Optional[float]:
         if self.response is None:
             return None
-        limit = self.response.getheader("X-Rate-Limit-Limit")
-        interval = self.response.getheader("X-Rate-Limit-Interval")
+        limit = self.response.headers.get("X-Rate-Limit-Limit")
+        interval = self.response.headers.get("X-Rate-Limit-Interval")
         if limit is None or interval is None:
             return None
         try:
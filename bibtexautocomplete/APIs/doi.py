@@ -20,6 +20,9 @@ class URLCheck(ConditionMixin[str, Optional[Data]], RedirectFollower[str, Option
     name = "url_checker"
     accept = "text/html"
     silent_fail = True
+    # Validity checks shouldn't be served stale from the disk cache,
+    # and check_url needs self.response, which cache hits leave unset
+    use_cache = False
 
     def condition(self) -> bool:
         return self.is_valid
@@ -53,6 +56,7 @@ class DOICheck(
 
     name = "doi_checker"
     silent_fail = True
+    use_cache = False  # same as URLCheck: don't cache validity checks
 
     params = {"type": "URL"}
     domain = "doi.org"
@@ -97,8 +101,8 @@ class DOICheck(
             final = checker.query()
             if final is not None and checker.response is not None:
                 # don't try to read content if not text
-                info = checker.response.headers
-                if info.get_content_maintype() != "text":
+                content_type = checker.response.headers.get("Content-Type", "")
+                if not content_type.startswith("text"):
                     return True
                 # Some websites, namely springer, don't send 404 for invalid DOIs...
                 # See: https://link.springer.com/deleted
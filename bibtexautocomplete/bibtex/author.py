@@ -2,10 +2,15 @@
 A class to represent author/editor names and read/write them to valid bibtex
 """
 
+from functools import lru_cache
 from typing import Any, List, Optional
 
 AUTHOR_JOIN = " and "
 
+# Parsed names are cached: the same authors show up in the source entry,
+# in several candidate results, and across lookups
+AUTHOR_CACHE_SIZE = 4096
+
 
 class Author:
     firstnames: Optional[str]
@@ -42,8 +47,11 @@ class Author:
         return False
 
     @staticmethod
+    @lru_cache(maxsize=AUTHOR_CACHE_SIZE)
     def from_name(name: Optional[str]) -> "Optional[Author]":
-        """Reads a bibtex string into a author name"""
+        """Reads a bibtex string into a author name
+        Cached, so a given name string is only parsed once.
+        Authors are never mutated after creation, sharing them is safe"""
         if name is None or name == "" or name.isspace():
             return None
         name = name.replace("\n", "").strip()
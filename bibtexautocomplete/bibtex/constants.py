@@ -72,6 +72,10 @@ FieldNamesSet: Set[FieldType] = {
 # Fields actually searched for
 SearchedFields = FieldNamesSet.copy()
 
+# Fields compared after title and DOI when matching two entries,
+# precomputed as matching runs once per candidate result
+SecondaryMatchFields: Set[FieldType] = FieldNamesSet - {FieldNames.TITLE, FieldNames.DOI}
+
 
 # Matching score range for fields
 FIELD_FULL_MATCH = 100
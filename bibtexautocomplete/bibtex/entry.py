@@ -3,7 +3,7 @@ Wraps around bibtexparser's entry representations for safer access
 and field normalization
 """
 
-from typing import Any, Dict, Set, cast
+from typing import Any, Dict, List, Optional, Set, cast
 
 from ..utils.constants import EntryType
 from .base_field import BibtexField
@@ -13,6 +13,7 @@ from .constants import (
     FIELD_NO_MATCH,
     FieldNamesSet,
     FieldType,
+    SecondaryMatchFields,
     cast_field_name,
 )
 from .fields import (
@@ -27,6 +28,7 @@ from .fields import (
     URLField,
     YearField,
 )
+from .normalize import normalize_str
 
 
 class BibtexEntry:
@@ -78,6 +80,11 @@ class BibtexEntry:
 
     id: str
 
+    # Query values cached by cache_query_fields, see query_title/query_authors
+    _query_title: Optional[str]
+    _query_authors: Optional[List[str]]
+    _query_fields_cached: bool
+
     def __init__(self, source: str):
         """Create a new empty entry,
         source identifies the data's provenance (i.e. lookup name, bibtex file...)"""
@@ -110,6 +117,32 @@ class BibtexEntry:
 
         self.id = "<unnamed>"
 
+        self._query_title = None
+        self._query_authors = None
+        self._query_fields_cached = False
+
+    def cache_query_fields(self) -> None:
+        """Compute and cache the values used to build lookup queries
+        Input entries are shared by all lookups, which would otherwise
+        redo the same normalization and author parsing"""
+        title = self.title.to_str()
+        self._query_title = normalize_str(title) if title is not None else None
+        authors = self.author.value
+        self._query_authors = None if authors is None else [author.lastname for author in authors]
+        self._query_fields_cached = True
+
+    def query_title(self) -> Optional[str]:
+        """The entry's normalized title, used in lookup queries"""
+        if not self._query_fields_cached:
+            self.cache_query_fields()
+        return self._query_title
+
+    def query_authors(self) -> Optional[List[str]]:
+        """The entry's author last names, used in lookup queries"""
+        if not self._query_fields_cached:
+            self.cache_query_fields()
+        return self._query_authors
+
     def get_field(self, field: FieldType) -> BibtexField[Any]:
         return cast(BibtexField[Any], self.__getattribute__(field))
 
@@ -139,7 +172,7 @@ class BibtexEntry:
         if total <= ENTRY_NO_MATCH:
             return ENTRY_NO_MATCH
         # match all other fields
-        for field in FieldNamesSet - {"title", "doi"}:
+        for field in SecondaryMatchFields:
             score = self.get_field(field).matches(other.get_field(field))
             if score is not None:
                 if field in FIELD_MULTIPLIERS:
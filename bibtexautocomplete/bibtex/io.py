@@ -81,5 +81,7 @@ def file_read(filepath: Path) -> BibDatabase:
 
 
 def get_entries(db: BibDatabase) -> List[EntryType]:
-    """Get entries from a bibdatabase"""
-    return list(db.entries)
+    """Get entries from a bibdatabase
+    Returns the database's list directly (no copy): callers only iterate it,
+    and it is walked once per database every time the completer is iterated"""
+    return cast(List[EntryType], db.entries)
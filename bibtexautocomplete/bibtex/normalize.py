@@ -3,7 +3,8 @@ Functions used to normalize bibtex fields
 """
 
 import unicodedata
-from re import search, sub
+from functools import lru_cache
+from re import compile as re_compile
 from typing import Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit
 
@@ -47,13 +48,40 @@ def strip_accents(string: str) -> str:
     return "".join(c for c in unicodedata.normalize("NFD", string) if unicodedata.category(c) != "Mn")
 
 
+# Normalized forms are cached as entry fields are re-normalized for every
+# candidate result they are compared against. Only short strings (i.e. bibtex
+# fields, not webpage contents) are cached to bound memory usage
+NORMALIZE_CACHE_SIZE = 4096
+NORMALIZE_CACHED_MAX_LEN = 512
+
+# Precompiled, these run on every string comparison
+WHITESPACE_RUN_REGEX = re_compile(r"\s+")
+SPACE_RUN_REGEX = re_compile(r" {2,}")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_str_weak(string: str) -> str:
+    string = latex_to_unicode(string)
+    string = strip_accents(string).lower()
+    return WHITESPACE_RUN_REGEX.sub(" ", string)
+
+
 def normalize_str_weak(string: str) -> str:
     """Converts to lower case, strips accents,
     replace tabs and newline with spaces,
     removes duplicate spaces"""
+    if len(string) > NORMALIZE_CACHED_MAX_LEN:
+        return _normalize_str_weak.__wrapped__(string)
+    return _normalize_str_weak(string)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_str(string: str) -> str:
     string = latex_to_unicode(string)
-    string = strip_accents(string).lower()
-    return sub(r"\s+", " ", string)
+    # Not a regex substitution: \w matches underscores
+    # and misses some unicode numeric forms (e.g. fractions)
+    mapped = "".join(x if x.isalnum() else " " for x in strip_accents(string))
+    return SPACE_RUN_REGEX.sub(" ", mapped).lower().strip()
 
 
 def normalize_str(string: str) -> str:
@@ -61,26 +89,18 @@ def normalize_str(string: str) -> str:
     Converts to lower case, strips accents
     Replaces all non alpha-numeric characters with spaces
     Removes duplicate spaces"""
-    string = latex_to_unicode(string)
-    res = ""
-    prev_space = False
-    for x in strip_accents(string):
-        if x.isalnum():
-            res += x
-            prev_space = False
-        elif not prev_space:
-            res += " "
-            prev_space = True
-    return res.lower().strip()
+    if len(string) > NORMALIZE_CACHED_MAX_LEN:
+        return _normalize_str.__wrapped__(string)
+    return _normalize_str(string)
 
 
-DOI_REGEX = r"(10\.\d{4,5}\/[\S]+[^;,.\s])$"
+DOI_REGEX = re_compile(r"(10\.\d{4,5}\/[\S]+[^;,.\s])$")
 
 
 def normalize_doi(doi_or_url: Optional[str]) -> Optional[str]:
     """Returns doi to canonical form (i.e. removing url)"""
     if doi_or_url is not None:
-        match = search(DOI_REGEX, doi_or_url)
+        match = DOI_REGEX.search(doi_or_url)
         if match is not None:
             return match.group(1).lower()  # DOI's are case insensitive
     return None
@@ -4,12 +4,12 @@ main class used to manage calls to different lookups
 """
 
 from datetime import datetime
-from functools import reduce
 from json import dump as json_dump
 from logging import INFO
 from pathlib import Path
 from re import sub
 from threading import Condition
+from time import time
 from typing import (
     Any,
     Callable,
@@ -22,7 +22,6 @@ from typing import (
     Set,
     Tuple,
     TypeVar,
-    cast,
 )
 
 from alive_progress import alive_bar  # type: ignore
@@ -36,12 +35,14 @@ from ..bibtex.io import file_read, file_write, get_entries
 from ..bibtex.normalize import has_field
 from ..lookups.abstract_entry_lookup import LookupType
 from ..utils.constants import (
+    AUTOSAVE_DELAY,
     BULLET,
     FIELD_PREFIX,
     MARKED_FIELD,
     MAX_THREAD_NB,
     EntryType,
 )
+from ..utils.functions import memoize
 from ..utils.logger import VERBOSE_INFO, logger
 from ..utils.only_exclude import OnlyExclude
 from .data_dump import DataDump
@@ -51,19 +52,6 @@ T = TypeVar("T")
 Q = TypeVar("Q")
 
 
-def memoize(method: Callable[[T], Q]) -> Callable[[T], Q]:
-    """Simple decorator for no argument method memoization
-    as an attribute"""
-    attribute = "_memoize_" + method.__name__
-
-    def new_method(self: T) -> Q:
-        if not hasattr(self, attribute):
-            setattr(self, attribute, method(self))
-        return cast(Q, getattr(self, attribute))
-
-    return new_method
-
-
 class Changes(NamedTuple):
     """An atomic change to the bib file"""
 
@@ -91,6 +79,9 @@ class BibtexAutocomplete(Iterable[EntryType]):
     changed_fields: int
     changed_entries: int
 
+    # Time of the last intermediate save
+    last_save: float
+
     # Ordered list of (entry, changes) where
     # changes is a list of (field, new_value, source)
     changes: List[Tuple[str, List[Changes]]]
@@ -123,6 +114,7 @@ class BibtexAutocomplete(Iterable[EntryType]):
         self.changes = []
         self.dumps = []
         self.output = output
+        self.last_save = 0.0
         self.prefix = FIELD_PREFIX if prefix else ""
         self.mark = mark
         if ignore_mark:
@@ -140,8 +132,7 @@ class BibtexAutocomplete(Iterable[EntryType]):
     @memoize
     def count_entries(self) -> int:
         """count the number of entries"""
-        # Its official, functional programming has infected me...
-        return reduce(lambda x, _y: x + 1, self, 0)
+        return sum(1 for _ in self)
 
     def print_filters(self) -> None:
         """Prints entry filter effects"""
@@ -173,7 +164,13 @@ class BibtexAutocomplete(Iterable[EntryType]):
         for x in entries:
             bib = BibtexEntry("input")
             bib.from_entry(x)
+            # Normalize query fields once, before the entry is
+            # handed to every lookup thread
+            bib.cache_query_fields()
             bib_entries.append(bib)
+        # Let lookups perform batched queries before per-entry dispatch
+        for lookup in self.lookups:
+            lookup.prefetch(bib_entries)
         condition = Condition()
         assert len(self.lookups) < MAX_THREAD_NB
         threads: List[LookupThread] = []
@@ -232,7 +229,9 @@ class BibtexAutocomplete(Iterable[EntryType]):
 
         dump = DataDump(entry_id)
         for thread in threads:
-            result, info = thread.result[position]
+            thread_result = thread.result[position]
+            assert thread_result is not None  # guaranteed once position < thread.position
+            result, info = thread_result
             dump.add_entry(thread.lookup.name, result, info)
             if result is not None:
                 results.append(result)
@@ -261,7 +260,6 @@ class BibtexAutocomplete(Iterable[EntryType]):
             self.changed_entries += 1
             self.changed_fields += len(changes)
             self.changes.append((entry_id, changes))
-        print('find new fields', str(dump.new_fields))
         logger.verbose_info(
             BULLET + "{StBold}{entry}{StBoldOff} {nb} new fields",
             entry=entry["ID"].ljust(self.get_id_padding()),
@@ -275,8 +273,13 @@ class BibtexAutocomplete(Iterable[EntryType]):
         # fuqingxu edit fin
         if self.mark:
             entry[MARKED_FIELD] = datetime.today().strftime("%Y-%m-%d")
-        if self.output is not None:
+        # Intermediate save, so little is lost on interruption.
+        # Throttled: writing all output files after every entry is
+        # quadratic in the bibliography size. The caller performs
+        # the final write once autocompletion is done
+        if self.output is not None and time() - self.last_save >= AUTOSAVE_DELAY:
             self.write(self.output)
+            self.last_save = time()
 
     def combine_field(self, results: List[BibtexEntry], fieldname: FieldType) -> Optional[BibtexField[Any]]:
         """Combine the values of a single field"""
@@ -12,6 +12,7 @@ from ..utils.constants import (
     FIELD_PREFIX,
     LICENSE,
     MARKED_FIELD,
+    PARALLEL_QUERY_NB,
     SCRIPT_NAME,
     URL,
     VERSION_DATE,
@@ -30,6 +31,7 @@ from .parser import (
     make_output_names,
     parser,
 )
+from .threads import LookupThread
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -49,6 +51,7 @@ def main(argv: Optional[List[str]] = None) -> None:
             ansi_format(
                 HELP_TEXT,
                 TIMEOUT=CONNECTION_TIMEOUT,
+                PARALLEL=PARALLEL_QUERY_NB,
                 VERSION=VERSION_STR,
                 VERSION_DATE=VERSION_DATE,
                 LOOKUPS=", ".join(LOOKUP_NAMES),
@@ -91,6 +94,8 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     HTTPSLookup.connection_timeout = args.timeout if args.timeout > 0.0 else None
     HTTPSLookup.ignore_ssl = args.ignore_ssl
+    HTTPSLookup.use_cache = not args.no_cache
+    LookupThread.parallel_queries = max(1, args.parallel)
     lookups = OnlyExclude[str].from_nonempty(args.only_query, args.dont_query).filter(LOOKUPS, lambda x: x.name)
     if args.only_query != []:
         # remove duplicate from list
@@ -8,7 +8,12 @@ from pathlib import Path
 from typing import Iterable, List, TypeVar
 
 from ..bibtex.constants import FieldNamesSet
-from ..utils.constants import BTAC_FILENAME, CONNECTION_TIMEOUT, SCRIPT_NAME
+from ..utils.constants import (
+    BTAC_FILENAME,
+    CONNECTION_TIMEOUT,
+    PARALLEL_QUERY_NB,
+    SCRIPT_NAME,
+)
 from ..utils.logger import logger
 from .apis import LOOKUP_NAMES
 
@@ -136,11 +141,13 @@ parser.add_argument("--mark", "-m", action="store_true")
 parser.add_argument("--ignore-mark", "-M", action="store_true")
 
 parser.add_argument("--timeout", "-t", type=float, default=CONNECTION_TIMEOUT)
+parser.add_argument("--parallel", "-P", type=int, default=PARALLEL_QUERY_NB)
 parser.add_argument("--verbose", "-v", action="count", default=0)
 
 parser.add_argument("--silent", "-s", action="store_true")
 parser.add_argument("--no-color", "-n", action="store_true")
 parser.add_argument("--ignore-ssl", "-S", action="store_true")
+parser.add_argument("--no-cache", "-N", action="store_true")
 
 parser.add_argument("--version", action="store_true")
 parser.add_argument("--help", "-h", action="store_true")
@@ -228,6 +235,10 @@ More information and demo:
   {FgYellow}-t --timeout{Reset} {FgGreen}<float>{Reset}  set timeout on request, default: {TIMEOUT} s
         Set to -1 for no timeout.
   {FgYellow}-S --ignore-ssl{Reset}       Ignore SSL verification when performing queries
+  {FgYellow}-N --no-cache{Reset}         Don't cache responses on disk nor reuse cached ones
+        Responses are cached in ~/.cache/bibtex-autocomplete/ for 30 days
+  {FgYellow}-P --parallel{Reset} {FgGreen}<int>{Reset}    number of entries each website is queried
+        about in parallel, default: {PARALLEL}. Set to 1 to query serially
 
   {FgYellow}-d --dump-data{Reset} {FgGreen}<file.json>{Reset} writes all data from matching entries to
         the given file in JSON format, so data from multiple sources can be compared
@@ -1,8 +1,10 @@
-from threading import Condition, Thread
-from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Thread, current_thread
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
 
 from ..bibtex.entry import BibtexEntry
 from ..lookups.abstract_entry_lookup import LookupType
+from ..utils.constants import PARALLEL_QUERY_NB
 from ..utils.logger import logger
 from ..utils.safe_json import JSONType
 
@@ -10,18 +12,27 @@ from ..utils.safe_json import JSONType
 class LookupThread(Thread):
     """As we our I/O limited,
     we can use threads to perform queries
-    We create one thread per lookup, to keep query rate polite for each domain"""
+    We create one thread per lookup, to keep query rate polite for each domain
+
+    Each thread uses a small pool of workers so that queries for several
+    entries overlap their network wait. The rate cap on queries to a same
+    domain is still respected (see HTTPSRateCapedLookup)"""
+
+    # Number of entry queries kept in flight by each lookup thread
+    # Set from the -P / --parallel command line option
+    parallel_queries: ClassVar[int] = PARALLEL_QUERY_NB
 
     lookup: LookupType
     entries: List[BibtexEntry] = []  # Read only
     condition: Condition
-    entry_name: Optional[str]
     result: List[
-        Tuple[
-            Optional[BibtexEntry],
-            Dict[str, JSONType],
+        Optional[
+            Tuple[
+                Optional[BibtexEntry],
+                Dict[str, JSONType],
+            ]
         ]
-    ]  # Write
+    ]  # Write, indexed by entry, None while unresolved
 
     position: int
     nb_entries: int
@@ -38,7 +49,7 @@ class LookupThread(Thread):
         self.condition = condition
         self.position = 0
         self.nb_entries = len(entries)
-        self.result = []
+        self.result = [None] * self.nb_entries
 
         self.bar = bar
         super().__init__(name=lookup.name, daemon=True)
@@ -46,28 +57,33 @@ class LookupThread(Thread):
     def run(self) -> None:
         """Starts querying for entries"""
         logger.very_verbose_debug("Starting thread {name}", name=self.name)
-        self.condition.acquire()
-        while self.position < self.nb_entries:
-            entry = self.entries[self.position]
-            self.entry_name = entry.id
-            lookup = self.lookup(entry)
-            self.condition.release()
+        with ThreadPoolExecutor(max_workers=self.parallel_queries, thread_name_prefix=self.name) as executor:
+            for _ in executor.map(self.query_entry, range(self.nb_entries)):
+                pass
+        return None
 
-            try:
-                result = lookup.query()
-            except Exception as err:
-                result = None
-                logger.traceback(
-                    "Uncaught exception when trying to autocomplete entry\n"
-                    f"Entry = {self.entry_name}\n"
-                    f"Website = {self.name}",
-                    err,
-                )
+    def query_entry(self, index: int) -> None:
+        """Performs all queries for the entry at the given index,
+        then advances self.position past all resolved entries"""
+        entry = self.entries[index]
+        # Queries run on pool worker threads: tag them with the entry name
+        # so that logged warnings identify the entry being processed
+        current_thread().entry_name = entry.id  # type: ignore[attr-defined]
+        lookup = self.lookup(entry)
+        try:
+            result = lookup.query()
+        except Exception as err:
+            result = None
+            logger.traceback(
+                f"Uncaught exception when trying to autocomplete entry\nEntry = {entry.id}\nWebsite = {self.name}",
+                err,
+            )
 
-            self.condition.acquire()
-            self.result.append((result, lookup.get_last_query_info()))
-            self.position += 1
-            self.bar()
+        with self.condition:
+            self.result[index] = (result, lookup.get_last_query_info())
+            # self.position is the number of entries forming a fully
+            # resolved prefix, as the main thread reads results in order
+            while self.position < self.nb_entries and self.result[self.position] is not None:
+                self.position += 1
+                self.bar()
             self.condition.notify()
-        self.condition.release()
-        return None
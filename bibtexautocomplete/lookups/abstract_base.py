@@ -18,7 +18,7 @@ AbstractDataLookup(AbstractLookup): split query into two new methods:
   - process_data : Self, Data -> BibtexEntry - process data into a bibtex entry
 """
 
-from typing import ClassVar, Dict, Generic, NamedTuple, Optional, Protocol, TypeVar
+from typing import Any, ClassVar, Dict, Generic, List, NamedTuple, Optional, Protocol, TypeVar
 
 from ..utils.safe_json import JSONType
 
@@ -42,6 +42,15 @@ class LookupProtocol(Protocol, Generic[Input, Output]):
         """Extra information to add to the data-dump about this query"""
         return dict()
 
+    @classmethod
+    def prefetch(cls, entries: List[Any]) -> None:
+        """Called once with all entries before per-entry queries start
+        Lookups can override this to perform batched queries
+        and cache their results (default: do nothing)
+        Typed List[Any] and not List[Input]: Input is covariant,
+        which protocols forbid in argument position"""
+        return None
+
     def __init__(self, input: Input) -> None:
         pass
 
@@ -63,6 +72,15 @@ class AbstractLookup(Generic[Input, Output]):
         """Extra information to add to the data-dump about this query"""
         return dict()
 
+    @classmethod
+    def prefetch(cls, entries: List[Any]) -> None:
+        """Called once with all entries before per-entry queries start
+        Lookups can override this to perform batched queries
+        and cache their results (default: do nothing)
+        Typed List[Any] and not List[Input]: Input is covariant,
+        which protocols forbid in argument position"""
+        return None
+
     def __init__(self, input: Input) -> None:
         pass
 
@@ -2,16 +2,26 @@
 Lookup for HTTPS queries
 """
 
-from http.client import HTTPResponse, HTTPSConnection
+from hashlib import sha1
+from os import environ
+from pathlib import Path
 from socket import gaierror, timeout
-from ssl import _create_unverified_context
+from threading import Lock
 from time import sleep, time
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 from urllib.parse import urlencode
+
 import requests
+from urllib3 import disable_warnings
 
 from ..bibtex.normalize import normalize_url
-from ..utils.constants import CONNECTION_TIMEOUT, MIN_QUERY_DELAY, USER_AGENT
+from ..utils.constants import (
+    CACHE_FOLDER_NAME,
+    CACHE_TTL,
+    CONNECTION_TIMEOUT,
+    MIN_QUERY_DELAY,
+    USER_AGENT,
+)
 from ..utils.logger import Hint, logger
 from ..utils.safe_json import JSONType
 from .abstract_base import AbstractDataLookup, Data, Input, Output
@@ -23,66 +33,63 @@ SSL_Fail_Hint = Hint(
     "Alternatively, you can disable queries to this domain with -Q / --dont-query"
 )
 TIMEOUT_Hint = Hint("you can increase timeout with -t / --timeout option.")
-import json
-import os
-import pickle
-from threading import Lock
 
-CACHE_FILE = "cache.pkl"
-cache_lock = Lock()
 
-def objdump(obj, file=CACHE_FILE):
-    import pickle
+# Successful responses are cached on disk (one sha1-named file per URL),
+# making re-runs on a same bibliography mostly free of network queries.
+# Disabled with the -N / --no-cache flag, entries expire after CACHE_TTL
+CACHE_DIR = Path(environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / CACHE_FOLDER_NAME
 
-    with open(file, "wb+") as f:
-        pickle.dump(obj, f)
 
-    with open(file, "rb") as f:
-        try:
-            pickle.load(f)
-        except EOFError:
-            print('wtf')
+def cache_file(url: str) -> Path:
+    """Path of the cache file for the given URL"""
+    return CACHE_DIR / sha1(url.encode()).hexdigest()
 
-    return
 
-def objload(file=CACHE_FILE):
-    import pickle, os
+def read_cache(url: str) -> Optional[bytes]:
+    """Returns the cached response for the given URL,
+    or None if absent or older than CACHE_TTL"""
+    file = cache_file(url)
+    try:
+        if time() - file.stat().st_mtime > CACHE_TTL:
+            return None
+        return file.read_bytes()
+    except OSError:
+        return None
 
-    if not os.path.exists(file):
-        return
-    with open(file, "rb") as f:
-        return pickle.load(f)
 
-def load_cache():
-    """
-    Load the cache file if it exists, otherwise returns an empty dictionary.
-    """
-    if os.path.exists(CACHE_FILE):
-        with cache_lock:
-            return objload(CACHE_FILE)
-    return {}
+def write_cache(url: str, data: bytes) -> None:
+    """Caches the response for the given URL, ignoring write failures"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        file = cache_file(url)
+        tmp = file.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(file)
+    except OSError:
+        pass
 
-def save_cache(cache_data):
-    """
-    Save the cache data to the cache file.
-    """
-    with cache_lock:
-        objdump(cache_data, CACHE_FILE)
 
-def read_cache(url):
-    """
-    Reads cache data for the given URL if available.
-    """
-    cache_data = load_cache()
-    return cache_data.get(url)
+# Sessions used for queries, one per domain
+# Reusing a session keeps the underlying connection alive,
+# avoiding a new TCP + TLS handshake on every query
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = Lock()
+
+
+def get_session(domain: str) -> requests.Session:
+    """Return the shared keep-alive session for the given domain"""
+    with _sessions_lock:
+        if domain not in _sessions:
+            _sessions[domain] = requests.Session()
+        return _sessions[domain]
+
+
+# Merged request headers, computed once per (class, host) pair:
+# they only depend on class attributes and the target host,
+# so there is no point rebuilding them on every query
+_headers_cache: Dict[Tuple[Type[Any], str], Dict[str, str]] = {}
 
-def write_cache(url, data):
-    """
-    Writes data to the cache for the given URL.
-    """
-    cache_data = load_cache()
-    cache_data[url] = data
-    save_cache(cache_data)
 
 class HTTPSLookup(AbstractDataLookup[Input, Output]):
     """Abstract class to wrap https queries:
@@ -115,6 +122,7 @@ class HTTPSLookup(AbstractDataLookup[Input, Output]):
 
     ignore_ssl: ClassVar[bool] = False
     silent_fail: ClassVar[bool] = False
+    use_cache: ClassVar[bool] = True
 
     # Safe parameters kept in urlencode
     safe: str = ""
@@ -124,21 +132,28 @@ class HTTPSLookup(AbstractDataLookup[Input, Output]):
     default_headers: Dict[str, str] = {
         "User-Agent": USER_AGENT,
         "Accept": accept,
+        "Connection": "keep-alive",
     }
     headers: Dict[str, str] = {}
 
     connection_timeout: Optional[float] = CONNECTION_TIMEOUT
 
-    response: Optional[HTTPResponse] = None
+    response: Optional[requests.Response] = None
 
     _last_query_info: Dict[str, JSONType] = {}
 
     def get_headers(self) -> Dict[str, str]:
-        """Return the headers used in an HTTPS request"""
-        headers = self.default_headers.copy()
-        headers["Accept"] = self.accept
-        headers.update(self.headers)
-        headers["Host"] = self.get_host()
+        """Return the headers used in an HTTPS request
+        The merged dict is shared between queries: callers must not mutate it"""
+        host = self.get_host()
+        key = (type(self), host)
+        headers = _headers_cache.get(key)
+        if headers is None:
+            headers = self.default_headers.copy()
+            headers["Accept"] = self.accept
+            headers.update(self.headers)
+            headers["Host"] = host
+            _headers_cache[key] = headers
         return headers
 
     def get_request(self) -> str:
@@ -181,6 +196,12 @@ class HTTPSLookup(AbstractDataLookup[Input, Output]):
         """Query body, can use self.entry to set them"""
         return None
 
+    def before_query(self) -> None:
+        """Hook called just before a network request is actually sent,
+        skipped when the response is served from the disk cache
+        Used by HTTPSRateCapedLookup to space out queries"""
+        return None
+
     def get_data(self) -> Optional[Data]:
         """main lookup function
         returns true if the lookup succeeded in finding all info
@@ -201,83 +222,47 @@ class HTTPSLookup(AbstractDataLookup[Input, Output]):
         start = time()
         fail_reason = ""
         try:
-            # if self.ignore_ssl:
-            #     connection = HTTPSConnection(
-            #         domain,
-            #         timeout=self.connection_timeout,
-            #         context=_create_unverified_context(),
-            #     )
-            # else:
-            #     connection = HTTPSConnection(domain, timeout=self.connection_timeout)
-            # connection.request(
-            #     request,
-            #     path,
-            #     self.get_body(),
-            #     headers,
-            # )
-            # self.response = connection.getresponse()
-            # self._last_query_info = {
-            #     "url": url,
-            #     "response-time": delay,
-            #     "response-status": self.response.status,
-            # }
-            # logger.debug(
-            #     "response {status}{reason} in {delay}s",
-            #     status=self.response.status,
-            #     reason=" " + self.response.reason if self.response.reason else "",
-            #     delay=delay,
-            # )
-            # logger.very_verbose_debug("response headers: {headers}", headers=self.response.headers)
-            # data = self.response.read()
-            # connection.close()
-            # read from cache
-            # def read_cache(url):
-            #     import json, os
-            #     if os.path.exists("cache.json"):
-            #         with open("cache.json", "r") as f:
-            #             data = f.read()
-            #             try:
-            #                 st = json.loads(data)
-            #                 if url in st:
-            #                     return st[url]
-            #                 else:
-            #                     return None
-            #             except:
-            #                 return None
-            #     else:
-            #         return None
-            # def write_cache(url, data):
-            #     import json, os
-            #     if os.path.exists("cache.json"):
-            #         with open("cache.json", "r") as f:
-            #             pre_json = json.loads(f.read())
-            #     else:
-            #         pre_json = {}
-
-            #     pre_json[url] = data
-            #     with open("cache.json", "w") as f:
-            #         f.write(json.dumps(pre_json))
-
-
-
-            if read_cache(url) is not None:
-                text = read_cache(url)
-                print('read from cache:', url)
+            cached = read_cache(url) if self.use_cache else None
+            if cached is not None:
+                data = cached
                 response_status_code = 200
+                logger.debug("response from cache")
             else:
-                response = requests.request(
+                self.before_query()
+                # don't count the polite rate-limiting wait as response time
+                start = time()
+                if self.ignore_ssl:
+                    disable_warnings()
+                response = get_session(domain).request(
                     method=request,
                     url=url,
                     headers=headers,
+                    data=self.get_body(),
                     timeout=self.connection_timeout,
+                    verify=not self.ignore_ssl,
                 )
-                text = response.text
-                write_cache(url, text)
+                self.response = response
+                # Raw bytes, without the decode + re-encode of response.text
+                # Parsers (orjson, xmltodict) consume bytes directly
+                data = response.content
                 response_status_code = response.status_code
+                # Only cache successful GET queries
+                if self.use_cache and request == "GET" and response_status_code == 200:
+                    write_cache(url, data)
+                logger.very_verbose_debug("response headers: {headers}", headers=response.headers)
 
-            data = text.encode()
             delay = round(time() - start, 3)
-        except timeout:
+            self._last_query_info = {
+                "url": url,
+                "response-time": delay,
+                "response-status": response_status_code,
+            }
+            logger.debug(
+                "response {status} in {delay}s",
+                status=response_status_code,
+                delay=delay,
+            )
+        except (timeout, requests.exceptions.Timeout):
             if self.silent_fail:
                 return None
             logger.warn("connection timeout ({timeout}s)", timeout=self.connection_timeout)
@@ -327,7 +312,7 @@ class RedirectFollower(HTTPSLookup[Input, Output]):
         while data is not None and data.code in [301, 302, 303, 307]:
             if self.response is None:
                 return data
-            location = self.response.getheader("Location")
+            location = self.response.headers.get("Location")
             if location is None:
                 return data
             self.depth += 1
@@ -344,28 +329,62 @@ class RedirectFollower(HTTPSLookup[Input, Output]):
         return data
 
 
+class RateLimiter:
+    """Spaces queries to a given domain by at least delay seconds
+    Shared by all lookups to that domain, safe to use from parallel threads"""
+
+    delay: float  # time between queries, in seconds
+    last_query_time: float
+    lock: Lock
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.last_query_time = 0.0
+        self.lock = Lock()
+
+    def wait(self) -> None:
+        """Blocks until a new query can politely be sent, and records it"""
+        with self.lock:
+            wait = self.delay - (time() - self.last_query_time)
+            if wait >= 0.0:
+                logger.debug("Rate limiter: sleeping for {wait}s", wait=round(wait, 3))
+                sleep(wait)
+            self.last_query_time = time()
+
+
+# Rate limiters, one per domain
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = Lock()
+
+
+def get_rate_limiter(domain: str, delay: float = MIN_QUERY_DELAY) -> RateLimiter:
+    """Return the rate limiter shared by all lookups to the given domain
+    delay is only used when first creating the limiter"""
+    with _rate_limiters_lock:
+        if domain not in _rate_limiters:
+            _rate_limiters[domain] = RateLimiter(delay)
+        return _rate_limiters[domain]
+
+
 class HTTPSRateCapedLookup(HTTPSLookup[Input, Output]):
     """Add a rate cap to respect polite server requirements"""
 
-    # Time of last query
-    # This is a class attribute to the given lookup
-    last_query_time: float = 0
-    query_delay: float = MIN_QUERY_DELAY  # time between queries, in seconds
+    query_delay: float = MIN_QUERY_DELAY  # initial time between queries, in seconds
 
     def update_rate_cap(self) -> Optional[float]:
         """Returns the new delay between queries
         Override in subclasses to get delay request from query headers"""
         return None
 
+    def before_query(self) -> None:
+        # Only waits before real network queries:
+        # cache hits should not be rate limited
+        get_rate_limiter(self.get_domain(), self.query_delay).wait()
+
     def get_data(self) -> Optional[Data]:
-        since_last_query = time() - self.last_query_time
-        wait = self.query_delay - since_last_query
-        if wait >= 0.0:
-            logger.debug("Rate limiter: sleeping for {wait}s", wait=round(wait, 3))
-            sleep(wait)
-        self.__class__.last_query_time = time()
         data = super().get_data()
         new_cap = self.update_rate_cap()  # update rate cap with response headers
         if new_cap is not None:
-            self.__class__.query_delay = new_cap * 1.1  # round up for good measure
+            # round up for good measure
+            get_rate_limiter(self.get_domain(), self.query_delay).delay = new_cap * 1.1
         return data
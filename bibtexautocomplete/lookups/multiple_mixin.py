@@ -6,7 +6,6 @@ Set class attribute to be used by the query in get_data
 from typing import Iterator, List, Optional
 
 from ..bibtex.entry import BibtexEntry
-from ..bibtex.normalize import normalize_str
 from .abstract_base import AbstractLookup, Input, Output
 from .abstract_entry_lookup import AbstractEntryLookup
 
@@ -57,13 +56,11 @@ class DAT_Query_Mixin(MultipleQueryMixin[BibtexEntry, BibtexEntry], AbstractEntr
     authors: Optional[List[str]] = None
 
     def iter_queries(self) -> Iterator[None]:
-        self.title = self.entry.title.to_str()
-        if self.title is not None:
-            self.title = normalize_str(self.title)
+        # Normalized values are cached on the entry,
+        # which is shared by all lookups querying it
+        self.title = self.entry.query_title()
         self.doi = self.entry.doi.to_str()
-        authors = self.entry.author.value
-        if authors is not None:
-            self.authors = [author.lastname for author in authors]
+        self.authors = self.entry.query_authors()
 
         if self.query_doi and self.doi is not None:
             yield None
@@ -10,7 +10,7 @@ New virtual methods:
 
 from typing import Generic, Iterable, List, Optional, TypeVar
 
-from ..bibtex.constants import ENTRY_NO_MATCH
+from ..bibtex.constants import ENTRY_CERTAIN_MATCH, ENTRY_NO_MATCH
 from ..bibtex.entry import BibtexEntry
 from ..utils.logger import logger
 from .abstract_base import Data
@@ -93,6 +93,9 @@ class SearchResultMixin(Generic[result]):
             if score > max_score:
                 max_score = score
                 max_entry = entry
+                if max_score >= ENTRY_CERTAIN_MATCH:
+                    # No need to check the remaining results
+                    break
         return max_entry
 
 
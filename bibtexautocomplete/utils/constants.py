@@ -33,6 +33,19 @@ EntryType = Dict[str, str]  # Type of a bibtex entry
 
 MAX_THREAD_NB = 10  # Max number of threads
 
+# Number of queries a single lookup thread keeps in flight
+# Queries to a same domain are still spaced by at least its query_delay
+PARALLEL_QUERY_NB = 4
+
+# Minimum delay between intermediate saves of the output files
+# during autocompletion (the final write always happens)
+AUTOSAVE_DELAY = 10.0  # seconds
+
+# On-disk cache for query responses, stored in
+# $XDG_CACHE_HOME/<CACHE_FOLDER_NAME> (defaults to ~/.cache/...)
+CACHE_FOLDER_NAME = "bibtex-autocomplete"
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+
 # Renaming pattern for nex files
 # name is the filename, without extension ("ex" for "ex.bib")
 # suffix is the file extansion, with leading dot (".bib" for "ex.bib")
@@ -42,6 +55,10 @@ BTAC_FILENAME = "{name}.btac{suffix}"
 # This allows for smaller data transfers
 QUERY_MAX_RESULTS = 10
 
+# Number of DOIs fetched in a single batched crossref query
+# Keeps the query URL well under the usual 4 KB server limit
+CROSSREF_BATCH_SIZE = 40
+
 # Prefix added to fields with -p / --prefix option
 FIELD_PREFIX = "BTAC"
 
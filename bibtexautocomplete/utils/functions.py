@@ -1,9 +1,24 @@
-from typing import Callable, Iterable, List, Optional, Set, Tuple, TypeVar
+from functools import wraps
+from typing import Callable, Iterable, List, Optional, Set, Tuple, TypeVar, cast
 
 T = TypeVar("T")
 Q = TypeVar("Q")
 
 
+def memoize(method: Callable[[T], Q]) -> Callable[[T], Q]:
+    """Simple decorator for no argument method memoization
+    as an attribute"""
+    attribute = "_memoize_" + method.__name__
+
+    @wraps(method)
+    def new_method(self: T) -> Q:
+        if not hasattr(self, attribute):
+            setattr(self, attribute, method(self))
+        return cast(Q, getattr(self, attribute))
+
+    return new_method
+
+
 def list_unduplicate(lst: List[T]) -> Tuple[List[T], Set[T]]:
     """Unduplicates a list, preserving order
     Returns of set of duplicated elements"""
@@ -3,9 +3,10 @@ A class for parsing JSON data without checking structure every time
 No operations will raise any error, invalid operations will simply return None
 """
 
-from json import JSONDecodeError, JSONDecoder
 from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+from orjson import JSONDecodeError, loads
+
 from .logger import logger
 
 JSONType = Union[Dict[str, "JSONType"], List["JSONType"], int, float, str, bool, None]
@@ -46,15 +47,20 @@ class SafeJSON:
     def from_str(json: str) -> "SafeJSON":
         """Parses a json string into SafeJSON, returns SafeJSON(None) if invalid string"""
         try:
-            decoded = JSONDecoder().decode(json)
+            decoded: JSONType = loads(json)
         except JSONDecodeError:
             return SafeJSON(None)  # empty
         return SafeJSON(decoded)
 
     @staticmethod
     def from_bytes(json: bytes) -> "SafeJSON":
-        """Parses a json bytes string into SafeJSON, returns SafeJSON(None) if invalid string"""
-        return SafeJSON.from_str(json.decode())
+        """Parses a json bytes string into SafeJSON, returns SafeJSON(None) if invalid string
+        Parses the bytes directly, without an intermediate decoded copy"""
+        try:
+            decoded: JSONType = loads(json)
+        except JSONDecodeError:
+            return SafeJSON(None)  # empty
+        return SafeJSON(decoded)
 
     def dict_contains(self, key: str) -> bool:
         """Returns true if self is a dict and has the given key"""
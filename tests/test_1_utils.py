@@ -7,6 +7,7 @@ import pytest
 from bibtexautocomplete.utils.functions import (
     list_sort_using,
     list_unduplicate,
+    memoize,
     split_iso_date,
 )
 from bibtexautocomplete.utils.only_exclude import OnlyExclude
@@ -74,6 +75,25 @@ def test_SafeJSON() -> None:
                 assert (i == 0) == x.to_bool()
 
 
+def test_memoize() -> None:
+    class Counter:
+        calls = 0
+
+        @memoize
+        def count(self) -> int:
+            Counter.calls += 1
+            return Counter.calls
+
+    a = Counter()
+    # The method is only evaluated once per instance
+    assert a.count() == 1
+    assert a.count() == 1
+    assert Counter.calls == 1
+    b = Counter()
+    assert b.count() == 2
+    assert a.count() == 1
+
+
 test_undup = [
     ([], ([], set())),
     ([1, 7, 6], ([1, 7, 6], set())),
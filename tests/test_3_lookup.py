@@ -1,5 +1,10 @@
-from typing import Dict, List, NamedTuple, Optional
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
 
+from pytest import MonkeyPatch
+
+import bibtexautocomplete.lookups.https as https
+from bibtexautocomplete.APIs.doi import DOICheck, URLCheck
 from bibtexautocomplete.bibtex.constants import FieldNames
 from bibtexautocomplete.bibtex.entry import BibtexEntry
 from bibtexautocomplete.bibtex.normalize import normalize_str
@@ -251,3 +256,36 @@ class TestCondition:
             False,
         )
         self.parent.fields_to_complete = old
+
+
+class FakeResponse:
+    """Network response stub, see TestDOICheckNoCache"""
+
+    status_code = 200
+    headers = {"Content-Type": "text/html"}
+    content = b"A perfectly valid article page"
+
+
+class FakeSession:
+    def request(self, **kwargs: Any) -> FakeResponse:
+        return FakeResponse()
+
+
+class TestDOICheckNoCache:
+    """DOI/URL validity checks must not be served from the disk cache:
+    cache hits leave self.response unset, which check_url relies on,
+    and a stale answer defeats the point of checking"""
+
+    def test_no_cache(self) -> None:
+        assert URLCheck.use_cache is False
+        assert DOICheck.use_cache is False
+
+    def test_check_url_ignores_cached_response(self, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        url = "https://example.com/article"
+        # A cached response for the checked URL must not short-circuit the check
+        monkeypatch.setattr(https, "CACHE_DIR", tmp_path)
+        https.write_cache(url, b"cached body")
+        monkeypatch.setattr(https, "get_session", lambda domain: FakeSession())
+        doi_check = DOICheck("10.1234/123456")
+        assert doi_check.condition()
+        assert doi_check.check_url(url) is True